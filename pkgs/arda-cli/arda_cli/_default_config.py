@@ -0,0 +1,11 @@
+"""Package default configuration as a Python literal.
+
+This mirrors arda_cli/arda.toml so that load_default_config() doesn't have to
+parse TOML at runtime. Keep the two in sync when changing defaults; the unit
+tests compare them.
+"""
+
+DEFAULT_CONFIG: dict = {
+    "theme": {"default": "forest"},
+    "output": {"verbose": False, "timestamp": True},
+}
@@ -1,25 +1,132 @@
 """Configuration management commands."""
 
+import functools
+from collections.abc import Callable
 from typing import Any
 
 import click
 import rich_click as rclick
-from rich.console import Console
 
 from arda_cli.lib.config import (
+    VALID_CONFIG_KEYS,
     get_active_config_path,
     get_config_for_viewing,
     get_config_for_writing,
     load_default_config,
     set_config_value,
 )
+from arda_cli.lib.output import (
+    build_extra_help_panel,
+    get_help_config,
+    get_output_manager,
+)
+from arda_cli.lib.rich_compat import get_console
+
+# The (section, setting) pairs this command may view and set
+ALLOWED_KEYS = VALID_CONFIG_KEYS
+
+# 'section.key' spelling of each allowed key mapped to its (section, setting)
+_FULL_KEYS = {
+    f"{section}.{setting}": (section, setting) for section, setting in ALLOWED_KEYS
+}
+
+# Every accepted spelling of a key (shorthand and 'section.key') mapped to
+# its (section, setting) pair
+_KEY_ALIASES = {
+    "theme": ("theme", "default"),
+    "verbose": ("output", "verbose"),
+    "timestamp": ("output", "timestamp"),
+    **_FULL_KEYS,
+}
 
-ALLOWED_KEYS = {
-    ("theme", "default"),
-    ("output", "verbose"),
-    ("output", "timestamp"),
+# Fallback values shown by 'config view' when a setting is missing
+_DEFAULTS: dict[tuple[str, str], str | bool] = {
+    ("theme", "default"): "dracula",
+    ("output", "verbose"): False,
+    ("output", "timestamp"): True,
 }
 
+# Display names used by 'config view'
+_SETTING_LABELS = {
+    ("theme", "default"): "Theme",
+    ("output", "verbose"): "Verbose",
+    ("output", "timestamp"): "Timestamp",
+}
+
+# Accepted spellings for boolean settings mapped to their value
+_BOOL_MAP: dict[str, bool] = {
+    **dict.fromkeys(("true", "1", "yes", "on"), True),
+    **dict.fromkeys(("false", "0", "no", "off"), False),
+}
+_BOOL_USAGE = "Use: true, 1, yes, on for true, or false, 0, no, off for false"
+
+# Human-readable list of valid keys for error messages
+_VALID_KEYS_STR = ", ".join(f"{s}.{k}" for s, k in sorted(ALLOWED_KEYS))
+
+
+def _lookup(config_data: dict, section: str, setting: str) -> Any:
+    """Look up section.setting in config_data, falling back to _DEFAULTS."""
+    default = _DEFAULTS[(section, setting)]
+    section_data = config_data.get(section)
+    if section_data is None:
+        return default
+    return section_data.get(setting, default)
+
+
+class _SimpleOutput:
+    """Minimal output helper used when the OutputManager can't be created."""
+
+    def __init__(self) -> None:
+        from rich.console import Console
+
+        self.console = Console()
+
+    def section(self, title: str) -> None:
+        self.console.print(f"\n[bold]{title}[/bold]")
+        self.console.print("─" * 50)
+
+    def info(self, message: str) -> None:
+        self.console.print("[cyan]i[/cyan] " + message)
+
+    def success(self, message: str) -> None:
+        self.console.print(f"[green]✓[/green] {message}")
+
+    def debug(self, message: str) -> None:
+        self.console.print(f"[dim]{message}[/dim]")
+
+    def warning(self, message: str) -> None:
+        self.console.print(f"[yellow]⚠[/yellow] {message}")
+
+    def error(self, message: str) -> None:
+        self.console.print(f"[red]✗[/red] {message}")
+
+
+@functools.cache
+def _get_fallback_output() -> _SimpleOutput:
+    """Return the shared fallback output helper, creating it on first use.
+
+    Created lazily rather than at import so that importing this module
+    doesn't construct a Console.
+    """
+    return _SimpleOutput()
+
+
+def _force_flags(ctx: click.Context | None) -> tuple[bool, bool]:
+    """Get the (force_global, force_local) flags stored by the config group."""
+    obj = ctx.obj if ctx is not None and ctx.obj else {}
+    return obj.get("force_global", False), obj.get("force_local", False)
+
+
+# Content of the Extra Help panel shown by 'arda config --help'
+_HELP_ITEMS = (
+    "Examples:",
+    ("arda config view", "View all settings"),
+    ("arda config view theme.default", "View specific setting"),
+    ("arda config set theme.default nord", "Set a value"),
+    ("arda config --local set theme nord", "Set in project config"),
+    ("arda config --global set theme nord", "Set in XDG config"),
+)
+
 
 def show_config_help(ctx: click.Context) -> None:
     """Show help with extra help panel."""
@@ -27,38 +134,17 @@ def show_config_help(ctx: click.Context) -> None:
     click.echo(ctx.get_help())
 
     # Get theme colors
-    from rich_click.rich_help_configuration import RichHelpConfiguration
-
     theme_name = ctx.obj.get("theme", "dracula") if ctx.obj else "dracula"
-    config = RichHelpConfiguration(theme=theme_name, enable_theme_env_var=True)
+    config = get_help_config(theme_name)
 
     # Get styles for different content types
     helptext_style = str(config.style_helptext_first_line or "default")
     option_style = str(config.style_option or "#5e81ac")
 
-    # Create styled content using the builder API
-    from arda_cli.lib.output import ExtraHelpPanelBuilder
-
-    builder = ExtraHelpPanelBuilder(
-        title="Extra Help",
-        theme=theme_name,
-        helptext_style=helptext_style,
+    panel = build_extra_help_panel(
+        _HELP_ITEMS, theme_name, helptext_style, option_style
     )
-
-    builder.add_description("Examples:").add_command(
-        "arda config view", "View all settings", option_style
-    ).add_command(
-        "arda config view theme.default", "View specific setting", option_style
-    ).add_command(
-        "arda config set theme.default nord", "Set a value", option_style
-    ).add_command(
-        "arda config --local set theme nord", "Set in project config", option_style
-    ).add_command(
-        "arda config --global set theme nord", "Set in XDG config", option_style
-    )
-
-    panel = builder.build()
-    console = Console()
+    console = get_console()
     console.print(panel)
 
     # Show active config (blank line before and after, matching arda --help)
@@ -151,37 +237,16 @@ def view_config(ctx: click.Context, key: str | None) -> None:
     """
     # Get or create output manager
     try:
-        from arda_cli.lib.output import get_output_manager
-
         output: Any = get_output_manager(ctx)
-        # Use console directly for clean output
-        console = output.console
     except Exception:
         # Fallback if output manager can't be created
-        from rich.console import Console
-
-        console = Console()
+        output = _get_fallback_output()
 
-        # Simple print helper
-        class SimpleOutput:
-            def section(self, title: str) -> None:
-                console.print(f"\n[bold]{title}[/bold]")
-                console.print("─" * 50)
-
-            def info(self, message: str) -> None:
-                console.print("[cyan]i[/cyan] " + message)
-
-            def warning(self, message: str) -> None:
-                console.print(f"[yellow]⚠[/yellow] {message}")
-
-            def error(self, message: str) -> None:
-                console.print(f"[red]✗[/red] {message}")
-
-        output = SimpleOutput()
+    # Use console directly for clean output
+    console = output.console
 
     # Get the force flags from context
-    force_global = ctx.obj.get("force_global", False) if ctx.obj else False
-    force_local = ctx.obj.get("force_local", False) if ctx.obj else False
+    force_global, force_local = _force_flags(ctx)
 
     # Get the full config with priority, respecting force flags
     config_data = get_config_for_viewing(
@@ -192,37 +257,30 @@ def view_config(ctx: click.Context, key: str | None) -> None:
         # Show all settings with clean, color-coded output
         output.section("Configuration")
 
-        theme_val = config_data.get("theme", {}).get("default", "dracula")
-        verbose_val = config_data.get("output", {}).get("verbose", False)
-        timestamp_val = config_data.get("output", {}).get("timestamp", True)
-
         # Color-coded output: setting name | hyphen | value
-        console.print(f"[cyan]Theme[/cyan] [dim]-[/dim] [white]{theme_val}[/white]")
-        console.print(f"[cyan]Verbose[/cyan] [dim]-[/dim] [white]{verbose_val}[/white]")
-        console.print(
-            f"[cyan]Timestamp[/cyan] [dim]-[/dim] [white]{timestamp_val}[/white]"
-        )
+        for section, setting in _DEFAULTS:
+            label = _SETTING_LABELS[(section, setting)]
+            value = _lookup(config_data, section, setting)
+            console.print(f"[cyan]{label}[/cyan] [dim]-[/dim] [white]{value}[/white]")
     else:
         # Show specific key
-        key_parts = key.split(".")
+        resolved = _FULL_KEYS.get(key)
 
         # Validate the key
-        if len(key_parts) != 2:
-            output.error(
-                "Invalid key format. Use 'section.key' (e.g., 'theme.default')"
-            )
-            return
-
-        key_tuple = tuple(key_parts)
-        if key_tuple not in ALLOWED_KEYS:
-            valid_keys = ", ".join(f"{k[0]}.{k[1]}" for k in sorted(ALLOWED_KEYS))
-            output.error(f"Invalid configuration key: {key}")
-            output.info(f"Valid keys: {valid_keys}")
+        if resolved is None:
+            if key.count(".") != 1:
+                output.error(
+                    "Invalid key format. Use 'section.key' (e.g., 'theme.default')"
+                )
+            else:
+                output.error(f"Invalid configuration key: {key}")
+                output.info(f"Valid keys: {_VALID_KEYS_STR}")
             return
 
-        section, setting = key_parts
+        section, setting = resolved
 
-        value = config_data.get(section, {}).get(setting)
+        section_data = config_data.get(section)
+        value = None if section_data is None else section_data.get(setting)
 
         if value is None:
             output.warning(f"Setting not found: {key}")
@@ -268,77 +326,29 @@ def set_config(ctx: click.Context, key: str, value: str) -> None:
     """
     # Get or create output manager
     try:
-        from arda_cli.lib.output import get_output_manager
-
         output: Any = get_output_manager(ctx)
     except Exception:
         # Fallback if output manager can't be created
-        from rich.console import Console
-
-        console = Console()
-
-        # Simple print helper
-        class SimpleOutput:
-            def section(self, title: str) -> None:
-                console.print(f"\n[bold]{title}[/bold]")
-                console.print("─" * 50)
-
-            def info(self, message: str) -> None:
-                console.print("[cyan]i[/cyan] " + message)
-
-            def success(self, message: str) -> None:
-                console.print(f"[green]✓[/green] {message}")
-
-            def debug(self, message: str) -> None:
-                console.print(f"[dim]{message}[/dim]")
-
-            def warning(self, message: str) -> None:
-                console.print(f"[yellow]⚠[/yellow] {message}")
-
-            def error(self, message: str) -> None:
-                console.print(f"[red]✗[/red] {message}")
-
-        output = SimpleOutput()
+        output = _get_fallback_output()
 
     # Get the force flags from context
-    force_global = ctx.obj.get("force_global", False) if ctx.obj else False
-    force_local = ctx.obj.get("force_local", False) if ctx.obj else False
+    force_global, force_local = _force_flags(ctx)
 
     # Parse and validate key
     # Support both shorthand (theme) and full (theme.default) formats
     key = key.lower()
-    if "." in key:
-        # Full format: theme.default
-        key_parts = key.split(".")
-        if len(key_parts) != 2:
+    resolved = _KEY_ALIASES.get(key)
+    if resolved is None:
+        if key.count(".") > 1:
             output.error(
                 "Invalid key format. Use 'section.key' (e.g., 'theme.default') "
                 "or shorthand (e.g., 'theme')"
             )
-            return
-        key_tuple = tuple(key_parts)
-        if key_tuple not in ALLOWED_KEYS:
-            valid_keys = ", ".join(f"{k[0]}.{k[1]}" for k in sorted(ALLOWED_KEYS))
-            output.error(f"Invalid configuration key: {key}")
-            output.info(f"Valid keys: {valid_keys}")
-            return
-        section, setting = key_parts
-    else:
-        # Shorthand format: theme, verbose, timestamp
-        # Map shorthand to full key
-        shorthand_map = {
-            "theme": ("theme", "default"),
-            "verbose": ("output", "verbose"),
-            "timestamp": ("output", "timestamp"),
-        }
-
-        if key not in shorthand_map:
-            valid_keys = ", ".join(f"{k[0]}.{k[1]}" for k in sorted(ALLOWED_KEYS))
+        else:
             output.error(f"Invalid configuration key: {key}")
-            output.info(f"Valid keys: {valid_keys}")
-            return
-
-        section, setting = shorthand_map[key]
+            output.info(f"Valid keys: {_VALID_KEYS_STR}")
+        return
+    section, setting = resolved
 
     # Parse and validate value
     try:
@@ -383,45 +393,16 @@ def init_config(ctx: click.Context, force: bool) -> None:
 
     """
     # Get the force flags from parent context
-    force_global = (
-        ctx.parent.obj.get("force_global", False) if ctx.parent.obj else False
-    )
-    force_local = ctx.parent.obj.get("force_local", False) if ctx.parent.obj else False
+    force_global, force_local = _force_flags(ctx.parent)
 
     # Get or create output manager
     try:
-        from arda_cli.lib.output import get_output_manager
-
         output: Any = get_output_manager(ctx)
     except Exception:
         # Fallback if output manager can't be created
-        from rich.console import Console
-
-        console = Console()
-
-        # Simple print helper
-        class SimpleOutput:
-            def section(self, title: str) -> None:
-                console.print(f"\n[bold]{title}[/bold]")
-                console.print("─" * 50)
-
-            def info(self, message: str) -> None:
-                console.print("[cyan]i[/cyan] " + message)
-
-            def success(self, message: str) -> None:
-                console.print(f"[green]✓[/green] {message}")
-
-            def warning(self, message: str) -> None:
-                console.print(f"[yellow]⚠[/yellow] {message}")
-
-            def error(self, message: str) -> None:
-                console.print(f"[red]✗[/red] {message}")
-
-        output = SimpleOutput()
+        output = _get_fallback_output()
 
     # Determine target config path
-    from arda_cli.lib.config import get_config_for_writing
-
     target_path = get_config_for_writing(
         force_global=force_global, force_local=force_local
     )
@@ -447,14 +428,34 @@ def init_config(ctx: click.Context, force: bool) -> None:
         # Write to file
         import tomli_w
 
-        with open(target_path, "wb") as f:
-            tomli_w.dump(default_config, f)
+        target_path.write_text(tomli_w.dumps(default_config), encoding="utf-8")
 
         output.success(f"Configuration initialized at {target_path}")
     except Exception as e:
         output.error(f"Failed to initialize configuration: {e}")
 
 
+def _parse_str(setting: str, value: str) -> str:
+    """Parse a string setting (e.g. the theme name) - kept as-is."""
+    return value
+
+
+def _parse_bool(setting: str, value: str) -> bool:
+    """Parse a boolean setting from its string form."""
+    result = _BOOL_MAP.get(value.lower())
+    if result is not None:
+        return result
+    raise ValueError(f"Invalid boolean value for {setting}: {value!r}\n{_BOOL_USAGE}")
+
+
+# Value parsers keyed by setting name
+_PARSERS: dict[str, Callable[[str, str], str | bool]] = {
+    "default": _parse_str,
+    "verbose": _parse_bool,
+    "timestamp": _parse_bool,
+}
+
+
 def parse_config_value(setting: str, value: str) -> str | bool:
     """Parse and validate a configuration value based on the setting type.
 
@@ -469,25 +470,7 @@ def parse_config_value(setting: str, value: str) -> str | bool:
         ValueError: If the value is invalid for the setting type
 
     """
-    if setting == "default":
-        # Theme name - keep as string
-        return value
-
-    elif setting in ("verbose", "timestamp"):
-        # Boolean values
-        value_lower = value.lower()
-        if value_lower in ("true", "1", "yes", "on"):
-            return True
-        elif value_lower in ("false", "0", "no", "off"):
-            return False
-        else:
-            valid_true = ", ".join(["true", "1", "yes", "on"])
-            valid_false = ", ".join(["false", "0", "no", "off"])
-            raise ValueError(
-                f"Invalid boolean value for {setting}: {value!r}\n"
-                f"Use: {valid_true} for true, or {valid_false} for false"
-            )
-
-    else:
-        # Unknown setting
+    parser = _PARSERS.get(setting)
+    if parser is None:
         raise ValueError(f"Unknown setting: {setting}")
+    return parser(setting, value)
@@ -1,24 +1,130 @@
 """Create new Arda world using flakes."""
 
-import getpass
-import json
+import errno
+import functools
 import os
 import re
-import shlex
-import subprocess
+import shutil
 import sys
+import threading
 from pathlib import Path
-from shutil import copytree
 
 import click
-import rich_click as rclick
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
 
 from arda_cli.lib.output import get_output_manager
 
+# Reflinks are only attempted on Linux; elsewhere template files are
+# always copied
+if sys.platform == "linux":
+    import fcntl
+
+# Valid world names: letters, numbers, hyphens and underscores, with at
+# least one letter or number
+_WORLD_NAME_RE = re.compile(r"\A(?=.*[A-Za-z0-9])[A-Za-z0-9_-]+\Z")
+
+# Permissions applied to the copied template, which arrives read-only
+# from the Nix store: 755 (rwxr-xr-x) for directories, 644 (rw-r--r--)
+# for files
+_DIR_MODE = 0o755
+_FILE_MODE = 0o644
+
+# FICLONE ioctl (linux/fs.h): make dst share src's data blocks on
+# filesystems that support reflinks (Btrfs, XFS, ...) instead of copying
+# bytes. Turned off after the first error saying reflinks aren't supported
+# (one of _REFLINK_UNSUPPORTED), since every template file is copied
+# between the same two filesystems; any other error is a real one.
+_FICLONE = 0x40049409
+_REFLINK_UNSUPPORTED = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL}
+)
+_reflink_supported = sys.platform == "linux"
+
+# Template paths - templates are in arda-core/templates/arda/
+# Following clan-core's pattern: templates are copied into the package
+# at arda_core_templates/arda during the Nix build process.
+# Both candidates are resolved once at import time.
+
+# Development path (running from source): arda-core root is 6 levels up
+_DEV_TEMPLATES_DIR = Path(__file__).parents[5] / "templates" / "arda"
+
+# Installed package path (templates copied into package)
+# In Nix-built packages, templates are copied to:
+#   $out/lib/pythonX.Y/site-packages/arda_cli/arda_core_templates
+# __file__ = .../site-packages/arda_cli/commands/flakes/create.py
+# Go up 2 levels to the arda_cli package, whatever the Python version
+_INSTALLED_TEMPLATES_DIR = Path(__file__).parents[2] / "arda_core_templates" / "arda"
+
+
+@functools.cache
+def _find_templates_dir() -> Path | None:
+    """Return the templates directory to use, or None if neither exists.
+
+    Templates don't appear or disappear while arda is running, so the
+    result is cached for the lifetime of the process.
+    """
+    if os.path.isdir(_DEV_TEMPLATES_DIR):
+        return _DEV_TEMPLATES_DIR
+    if os.path.isdir(_INSTALLED_TEMPLATES_DIR):
+        return _INSTALLED_TEMPLATES_DIR
+    return None
+
+
+def _copy_writable(src: str, dst: str) -> str:
+    """Copy a template file's contents and make the copy writable.
+
+    Used as the copytree copy_function so read-only Nix store modes are
+    never copied over, and no separate chmod pass over files is needed.
+    The copy is a reflink where the filesystem supports it.
+    """
+    global _reflink_supported
+
+    if sys.platform == "linux" and _reflink_supported:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError as e:
+                if e.errno not in _REFLINK_UNSUPPORTED:
+                    raise
+                _reflink_supported = False
+            else:
+                os.chmod(dst, _FILE_MODE)
+                return dst
+    shutil.copyfile(src, dst)
+    os.chmod(dst, _FILE_MODE)
+    return dst
+
+
+def _copy_template(template_path: Path, target_dir: Path) -> None:
+    """Copy a template to a new directory with writable permissions.
+
+    Files are made writable as they are copied; copytree copies directory
+    modes last, so directories get a pass of their own.
+    """
+    shutil.copytree(template_path, target_dir, copy_function=_copy_writable)
+    target_dir.chmod(_DIR_MODE)
+    for _root, dirs, _files, root_fd in os.fwalk(target_dir):
+        for d in dirs:
+            os.chmod(d, _DIR_MODE, dir_fd=root_fd)
+
+
+# Name of the thread that deletes whatever --force replaced
+_CLEANUP_THREAD_NAME = "arda-create-cleanup"
+
+
+def _remove_replaced(path: Path) -> None:
+    """Delete whatever --force replaced, ignoring errors.
+
+    The replaced target may be a directory, a symlink or a regular file;
+    only a real directory is removed recursively.
+    """
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
 
 def get_public_age_key_from_file(key_file_path: Path) -> str:
     """Extract the public key from an age key file.
@@ -33,6 +139,8 @@ def get_public_age_key_from_file(key_file_path: Path) -> str:
         ValueError: If no public key is found in the file
 
     """
+    import subprocess
+
     try:
         content = key_file_path.read_text().strip()
 
@@ -81,12 +189,13 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
     you will be prompted to enter a name.
     """
     output = get_output_manager(ctx)
+    # Prompts, progress and panels share the output manager's console
+    console = output.console
 
     # If name is not provided, prompt the user
     if name is None:
         from rich.prompt import Prompt
 
-        console = Console()
         name = Prompt.ask(
             "Enter the name of the world to create",
             console=console,
@@ -99,7 +208,7 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
             sys.exit(1)
 
     # Validate world name
-    if not name.replace("-", "").replace("_", "").isalnum():
+    if not _WORLD_NAME_RE.match(name):
         output.error(
             f"Invalid world name '{name}'. "
             "Use only letters, numbers, hyphens, and underscores."
@@ -109,58 +218,43 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
     # Determine target directory
     target_dir = Path(name).absolute()
 
-    # Check if directory exists
-    if target_dir.exists() and not force:
+    # Check if anything exists at the target, including a dangling symlink
+    # (remembered for the --force swap below)
+    target_exists = os.path.lexists(target_dir)
+    if target_exists and not force:
         output.error(
             f"Directory '{target_dir}' already exists. "
             f"Use --force to overwrite or choose a different name."
         )
         sys.exit(1)
 
-    # Get template path - templates are in arda-core/templates/arda/
-    # Following clan-core's pattern: templates are copied into the package
-    # at arda_core_templates/arda during the Nix build process
-
-    # Try development path first (running from source)
-    arda_core_root = Path(__file__).parent.parent.parent.parent.parent.parent
-    dev_templates_dir = arda_core_root / "templates" / "arda"
-
-    # Try installed package path (templates copied into package)
-    # In Nix-built packages, templates are copied to:
-    #   $out/lib/python3.13/site-packages/arda_cli/arda_core_templates
-    # Navigate from this module to find templates in the Nix store
-    # __file__ = .../site-packages/arda_cli/commands/flakes/create.py
-    # Go up 7 levels to package root, then down to templates
-    installed_templates_dir = (
-        Path(__file__).parent.parent.parent.parent.parent.parent.parent
-        / "lib"
-        / "python3.13"
-        / "site-packages"
-        / "arda_cli"
-        / "arda_core_templates"
-        / "arda"
-    )
-
     # Choose the right templates directory
-    if dev_templates_dir.exists():
-        templates_dir = dev_templates_dir
-    elif installed_templates_dir.exists():
-        templates_dir = installed_templates_dir
-    else:
+    templates_dir = _find_templates_dir()
+    if templates_dir is None:
         output.error(
             f"Template directory not found. "
-            f"Checked: {dev_templates_dir} and {installed_templates_dir}"
+            f"Checked: {_DEV_TEMPLATES_DIR} and {_INSTALLED_TEMPLATES_DIR}"
         )
         sys.exit(1)
 
     template_path = templates_dir / template
 
-    if not template_path.exists():
+    if not os.path.isdir(template_path):
         output.error(f"Template '{template}' not found at {template_path}")
         output.info("Available templates: default")
         sys.exit(1)
 
-    console = Console()
+    # Heavy imports are deferred until the arguments have been validated,
+    # so that other arda commands and invalid invocations don't pay for them
+    import getpass
+    import json
+    import subprocess
+    from collections import deque
+
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm
 
     # Confirm creation
     if not force:
@@ -173,56 +267,92 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
             sys.exit(0)
 
     # Create the world
+    trash_dir: Path | None = None
+    age_keygen: subprocess.Popen[bytes] | None = None
     try:
+        # The spinner is only drawn on a terminal; when output is redirected
+        # the progress updates cost nothing and logs stay free of redraws
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
             task = progress.add_task("Creating world...", total=None)
 
-            # 1. Remove directory if it exists
-            if target_dir.exists():
-                import shutil
-
-                shutil.rmtree(target_dir)
-
-            # 2. Copy template
-            progress.update(task, description="Copying template files...")
-            copytree(str(template_path), str(target_dir))
-
-            # 3. Recursively make all files and directories writable
-            # This ensures that files from the Nix store can be modified/deleted
+            # 1-3. Copy template and make everything writable
+            # Writable modes ensure files from the Nix store can be
+            # modified/deleted.
             # CRITICAL: This must happen BEFORE git init, otherwise git can't
             # create .git directory
-            progress.update(task, description="Making files writable...")
-            import os
-            import stat
-
-            # Make target directory writable FIRST
-            # Use 755 (rwxr-xr-x) for directories: owner full access, others
-            # read/execute
-            target_dir.chmod(
-                stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH
+            progress.update(task, description="Copying template files...")
+            if target_exists:
+                # --force: build the new world next to the old one and swap
+                # it in with renames, so a failed copy leaves the existing
+                # directory untouched. The old tree is deleted once the
+                # success panel has been shown.
+                staging_dir = (
+                    target_dir.parent / f".{target_dir.name}.staging-{os.getpid()}"
+                )
+                try:
+                    _copy_template(template_path, staging_dir)
+                except BaseException:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    raise
+                old_dir = target_dir.parent / f".{target_dir.name}.trash-{os.getpid()}"
+                try:
+                    target_dir.rename(old_dir)
+                except BaseException:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    raise
+                try:
+                    staging_dir.rename(target_dir)
+                except BaseException:
+                    # Put the existing world back where it was
+                    old_dir.rename(target_dir)
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    raise
+                # Only handed to the cleanup once both renames succeeded
+                trash_dir = old_dir
+            else:
+                _copy_template(template_path, target_dir)
+
+            # Start generating age keys if needed
+            # Match clan-core's behavior: generate keys at ~/.config/sops/age/keys.txt
+            # instead of inside the world directory, so git status stays clean.
+            # age-keygen doesn't depend on any of the steps below, so it runs
+            # in the background while git and nix do their work; step 7
+            # collects the result. It is started after the copy, so a failed
+            # copy never leaves it running.
+            xdg_config_home = os.getenv(
+                "XDG_CONFIG_HOME", os.path.expanduser("~/.config")
             )
+            age_key_path = Path(xdg_config_home) / "sops" / "age" / "keys.txt"
+            age_key_warning: str | None = None
 
-            # Then recursively chmod all files and subdirectories
-            for root, dirs, files in os.walk(target_dir):
-                for d in dirs:
-                    dir_path = Path(root) / d
-                    # Directories: 755 (rwxr-xr-x)
-                    dir_path.chmod(
-                        stat.S_IRWXU
-                        | stat.S_IRGRP
-                        | stat.S_IXGRP
-                        | stat.S_IROTH
-                        | stat.S_IXOTH
-                    )
-                for f in files:
-                    file_path = Path(root) / f
-                    # Files: 644 (rw-r--r--)
-                    file_path.chmod(
-                        stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH
+            # Probed once here; step 8 relies on this and the keygen result
+            age_key_exists = os.path.exists(age_key_path)
+            if not age_key_exists:
+                try:
+                    # Create the sops/age directory in user's config home
+                    age_key_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        age_keygen = subprocess.Popen(  # noqa: S603
+                            ["age-keygen", "-o", str(age_key_path)],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            shell=False,
+                        )
+                    except FileNotFoundError as e:
+                        age_key_warning = (
+                            f"Failed to generate age key: {e}. "
+                            "You can install 'age' package if you plan to use "
+                            "secrets management."
+                        )
+                except (PermissionError, OSError) as e:
+                    age_key_warning = (
+                        f"Could not create sops config directory: {e}. "
+                        "Skipping age key generation."
                     )
 
             # 4. Initialize git
@@ -231,49 +361,40 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
 
             # Clean up any existing .git file or directory
             # that might be left from failed init
+            # (one stat via isdir(); unlink tolerates a missing file)
             git_dir = target_dir / ".git"
-            if git_dir.exists():
-                try:
-                    if git_dir.is_dir():
-                        import shutil
-
-                        shutil.rmtree(git_dir)
-                    else:
-                        git_dir.unlink()
-                except Exception:
-                    pass
+            try:
+                if os.path.isdir(git_dir):
+                    shutil.rmtree(git_dir)
+                else:
+                    git_dir.unlink(missing_ok=True)
+            except Exception:
+                pass
 
             # Try to initialize git repository with regular init
             # This works even when running in a subdirectory of another git repo
             git_init_result = subprocess.run(
                 ["git", "init"],
                 cwd=target_dir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 shell=False,
             )
 
-            # Try to verify that git actually works by running rev-parse
-            # This tells us if the repository was initialized successfully
-            git_check = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=target_dir,
-                capture_output=True,
-                text=True,
-                shell=False,
-            )
-
-            if git_check.returncode == 0:
-                # Git commands work, so repository is initialized
+            # git init exits 0 whenever it created (or reinitialized) the
+            # repository, so its return code is all we need to check
+            if git_init_result.returncode == 0:
                 git_initialized = True
-                if git_init_result.returncode == 0:
-                    output.debug("Git repository initialized successfully")
-                else:
-                    output.debug(
-                        "Git repository initialized (git had warnings but works)"
-                    )
+                output.debug("Git repository initialized successfully")
+                # Point the git calls below straight at the new repository so
+                # they skip git's repository discovery
+                git_env = {
+                    **os.environ,
+                    "GIT_DIR": str(git_dir),
+                    "GIT_WORK_TREE": str(target_dir),
+                }
             else:
-                # Git doesn't work, initialization failed
                 git_initialized = False
                 error_msg = git_init_result.stderr.strip()
 
@@ -299,102 +420,119 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
                     subprocess.run(
                         ["git", "add", "."],
                         cwd=target_dir,
-                        capture_output=True,
+                        env=git_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
                         shell=False,
                         check=True,
                     )
                 except subprocess.CalledProcessError as e:
-                    output.warning(f"Could not add files to git: {e}")
+                    output.warning(
+                        f"Could not add files to git: {e.stderr.strip() or e}"
+                    )
                     git_initialized = False
 
             # 5. Update flake (only run if git was initialized)
             if git_initialized:
                 progress.update(task, description="Updating flake...")
-                result = subprocess.run(
+                # Stream nix's output into the spinner so the (network-bound)
+                # update shows progress; keep only the tail for diagnostics
+                flake_tail: deque[str] = deque(maxlen=20)
+                # Leaving the with block closes the pipe and waits for nix
+                with subprocess.Popen(
                     ["nix", "flake", "update"],
                     cwd=target_dir,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
                     text=True,
+                    bufsize=1,
                     shell=False,
-                )
+                ) as flake_update:
+                    try:
+                        for line in flake_update.stdout or ():
+                            line = line.rstrip()
+                            if line:
+                                flake_tail.append(line)
+                                progress.update(
+                                    task,
+                                    description=(
+                                        f"Updating flake: {escape(line[:60])}"
+                                    ),
+                                )
+                    except BaseException:
+                        # Don't leave nix running if streaming is interrupted
+                        flake_update.kill()
+                        raise
                 # Complete progress before logging, so logs appear on new line
                 progress.stop()
-                if result.returncode != 0:
+                if flake_update.returncode != 0:
                     output.warning(
                         "Flake update had warnings (this is normal for first run)"
                     )
+                    for line in flake_tail:
+                        output.debug(escape(line))
                 # Restart progress for next task
                 progress.start()
-                progress.update(task, description="Creating initial commit...")
 
             # 6. Create initial commit (only if git was initialized)
+            # Stage flake.lock, then commit; git's stderr is kept for the warning
             if git_initialized:
                 progress.update(task, description="Creating initial commit...")
-                subprocess.run(
-                    ["git", "add", "."],
-                    cwd=target_dir,
-                    capture_output=True,
-                    shell=False,
-                )
-                # Use shlex.quote to safely escape the world name
-                safe_name = shlex.quote(name)
-                commit_result = subprocess.run(  # noqa: S603
-                    ["git", "commit", "-m", f"Initial {safe_name} world"],
-                    cwd=target_dir,
-                    capture_output=True,
-                    text=True,
-                    shell=False,
-                )
-                if commit_result.returncode != 0:
+                try:
+                    subprocess.run(
+                        ["git", "add", "."],
+                        cwd=target_dir,
+                        env=git_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        shell=False,
+                        check=True,
+                    )
+                    # name has been validated against _WORLD_NAME_RE
+                    subprocess.run(  # noqa: S603
+                        ["git", "commit", "-m", f"Initial {name} world"],
+                        cwd=target_dir,
+                        env=git_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        shell=False,
+                        check=True,
+                    )
+                except subprocess.CalledProcessError as e:
                     output.warning(
-                        "Could not create initial commit, but files are ready"
+                        "Could not create initial commit, but files are ready: "
+                        f"{e.stderr.strip() or e}"
                     )
 
-            # 7. Generate age keys if needed
-            # Match clan-core's behavior: generate keys at ~/.config/sops/age/keys.txt
-            # instead of inside the world directory, so git status stays clean
+            # 7. Collect the age key generated in the background
             progress.update(task, description="Setting up secrets...")
-            xdg_config_home = os.getenv(
-                "XDG_CONFIG_HOME", os.path.expanduser("~/.config")
-            )
-            age_key_path = Path(xdg_config_home) / "sops" / "age" / "keys.txt"
-
-            if not age_key_path.exists():
-                try:
-                    # Create the sops/age directory in user's config home
-                    age_key_path.parent.mkdir(parents=True, exist_ok=True)
-                    try:
-                        subprocess.run(  # noqa: S603
-                            ["age-keygen", "-o", str(age_key_path)],
-                            check=True,
-                            capture_output=True,
-                            text=True,
-                            shell=False,
-                        )
-                        # Complete progress before logging, so logs appear on new line
-                        progress.stop()
-                        output.info(f"Generated age key at {age_key_path}")
-                        # Restart progress for next task
-                        progress.start()
-                    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                        # Complete progress before logging, so logs appear on new line
-                        progress.stop()
-                        output.warning(
-                            f"Failed to generate age key: {e}. "
-                            "You can install 'age' package if you plan to use "
-                            "secrets management."
-                        )
-                        # Restart progress for next task
-                        progress.start()
-                except (PermissionError, OSError) as e:
-                    # Complete progress before logging, so logs appear on new line
-                    progress.stop()
+            if age_keygen is not None:
+                age_keygen.wait()
+                # Complete progress before logging, so logs appear on new line
+                progress.stop()
+                age_key_exists = age_keygen.returncode == 0
+                if age_key_exists:
+                    output.info(f"Generated age key at {age_key_path}")
+                else:
+                    keygen_error = subprocess.CalledProcessError(
+                        age_keygen.returncode, age_keygen.args
+                    )
                     output.warning(
-                        f"Could not create sops config directory: {e}. "
-                        "Skipping age key generation."
+                        f"Failed to generate age key: {keygen_error}. "
+                        "You can install 'age' package if you plan to use "
+                        "secrets management."
                     )
-                    # Restart progress for next task
-                    progress.start()
+                # Restart progress for next task
+                progress.start()
+            elif age_key_warning is not None:
+                # Complete progress before logging, so logs appear on new line
+                progress.stop()
+                output.warning(age_key_warning)
+                # Restart progress for next task
+                progress.start()
 
             # 8. Create sops user directory and deploy age key
             # This matches clan-core's behavior: extract public key from age key
@@ -405,12 +543,21 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
                 username = getpass.getuser()
 
                 # Extract public key from age key file
-                if age_key_path.exists():
+                if age_key_exists:
                     try:
                         public_key = get_public_age_key_from_file(age_key_path)
 
                         # Create sops/users/<username> directory
                         sops_users_dir = target_dir / "sops" / "users" / username
+                        # The username becomes a path component; make sure it
+                        # can't point outside the world directory
+                        if not sops_users_dir.resolve().is_relative_to(
+                            target_dir.resolve()
+                        ):
+                            raise ValueError(
+                                f"Invalid username for sops user directory: "
+                                f"{username!r}"
+                            )
                         sops_users_dir.mkdir(parents=True, exist_ok=True)
 
                         # Write key.json with the public key
@@ -453,12 +600,17 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
                     subprocess.run(
                         ["git", "add", "."],
                         cwd=target_dir,
-                        capture_output=True,
+                        env=git_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
                         shell=False,
                         check=True,
                     )
                 except subprocess.CalledProcessError as e:
-                    output.warning(f"Could not add sops directory to git: {e}")
+                    output.warning(
+                        f"Could not add sops directory to git: {e.stderr.strip() or e}"
+                    )
 
             progress.update(task, description="Done!")
 
@@ -497,3 +649,16 @@ def create(ctx: click.Context, name: str | None, template: str, force: bool) ->
         output.debug("Full traceback:")
         output.debug(traceback.format_exc())
         sys.exit(1)
+    finally:
+        # Don't leave age-keygen running if a step above failed; wait()
+        # returns at once when step 7 already collected it
+        if age_keygen is not None:
+            age_keygen.wait()
+        # Remove the directory replaced by --force while the user reads the
+        # output; the thread isn't a daemon, so it still finishes before exit
+        if trash_dir is not None:
+            threading.Thread(
+                target=_remove_replaced,
+                args=(trash_dir,),
+                name=_CLEANUP_THREAD_NAME,
+            ).start()
@@ -3,7 +3,7 @@
 import click
 import rich_click as rclick
 
-from arda_cli.lib.output import get_output_manager, show_command_help
+from arda_cli.lib.output import show_command_help
 
 
 def host_help_callback(ctx: click.Context, param: click.Parameter, value: bool) -> None:
@@ -29,22 +29,6 @@ def host(ctx: click.Context) -> None:
 
     Manage your NixOS hosts with beautiful, themed output.
     """
-    output = get_output_manager(ctx)
-
-    # Show help when no subcommand is provided (matching arda --help)
-    if ctx.invoked_subcommand is None:
-        show_command_help(ctx)
-        ctx.exit()
-
-    output.info("Host management - coming soon!")
-
-    # Show example of themed output
-    output.success("System checks passed")
-    output.warning("1 host needs attention")
-    output.info("Total hosts: 5")
-
-    # Verbose operations list (only shown with --verbose)
-    output.section("Available operations")
-    output.debug("• List all hosts")
-    output.debug("• Deploy configuration")
-    output.debug("• Update host settings")
+    # Nothing to run yet, so show help (matching arda --help)
+    show_command_help(ctx)
+    ctx.exit()
@@ -14,32 +14,22 @@ def list(ctx: click.Context) -> None:
     output = get_output_manager(ctx)
 
     output.info("Available Rich-Click Themes")
+    themes = get_rich_click_themes()
 
     # Show total count in verbose mode
     if output.verbose:
-        total_themes = len(get_rich_click_themes())
-        output.debug(f"Total themes: {total_themes}")
-
-    output.spacer()
-
-    for theme_name in get_rich_click_themes():
-        # Print theme name (simpler formatting for list)
-        output.console.print(f"  [accent]{theme_name}[/accent]")
-
-    output.spacer()
-
-    # Show helpful info
-    output.console.print(
-        "Note: Themes can be combined with formats (slim, modern, nu, robo)"
-    )
-    output.console.print("Example: 'dracula-modern', 'forest-slim', 'nord-nu'")
-
-    output.spacer()
+        output.debug(f"Total themes: {len(themes)}")
 
+    # Theme names (simpler formatting for list) and the usage notes after
+    # them, with the blank lines between blocks, printed as one block
+    theme_names = "\n".join(f"  [accent]{theme_name}[/accent]" for theme_name in themes)
     output.console.print(
+        f"\n{theme_names}\n"
+        "\n"
+        "Note: Themes can be combined with formats (slim, modern, nu, robo)\n"
+        "Example: 'dracula-modern', 'forest-slim', 'nord-nu'\n"
+        "\n"
         "[dim]To preview a theme, use:[/dim] "
-        "[command]arda --theme <name> preview[/command]"
-    )
-    output.console.print(
+        "[command]arda --theme <name> preview[/command]\n"
         "[dim]Example:[/dim] [command]arda --theme nord preview[/command]"
     )
@@ -2,10 +2,26 @@
 
 import click
 import rich_click as rclick
-from rich.console import Console
 
-from arda_cli.commands.theme.list import list
-from arda_cli.commands.theme.preview import preview
+from arda_cli.lib.config import get_active_config_path
+from arda_cli.lib.lazy_group import LazyGroup
+from arda_cli.lib.output import build_extra_help_panel, get_help_config
+from arda_cli.lib.rich_compat import get_console
+
+# Content of the Extra Help panel shown by 'arda theme --help'
+_HELP_ITEMS = (
+    "Examples:",
+    ("arda theme list", "List all available themes"),
+    ("arda --theme nord preview", "Preview the nord theme"),
+    ("arda theme preview", "Preview the current theme"),
+    "",
+    "To preview a different theme:",
+    ("arda --theme <name> preview", "Preview a specific theme"),
+    "",
+    "To change the theme permanently:",
+    ("arda config set theme <theme>", "Set in project config"),
+    ("arda config --global set theme <theme>", "Set in user config"),
+)
 
 
 def show_theme_help(ctx: click.Context) -> None:
@@ -14,46 +30,21 @@ def show_theme_help(ctx: click.Context) -> None:
     click.echo(ctx.get_help())
 
     # Get theme colors
-    from rich_click.rich_help_configuration import RichHelpConfiguration
-
     theme_name = ctx.obj.get("theme", "dracula") if ctx.obj else "dracula"
-    config = RichHelpConfiguration(theme=theme_name, enable_theme_env_var=True)
+    config = get_help_config(theme_name)
 
     # Get styles for different content types
     helptext_style = str(config.style_helptext_first_line or "default")
     option_style = str(config.style_option or "#5e81ac")
 
-    # Create styled content using the builder API
-    # This is much simpler than manually creating Text objects and tuples!
-    from arda_cli.lib.output import ExtraHelpPanelBuilder
-
-    builder = ExtraHelpPanelBuilder(
-        title="Extra Help",
-        theme=theme_name,
-        helptext_style=helptext_style,
+    panel = build_extra_help_panel(
+        _HELP_ITEMS, theme_name, helptext_style, option_style
     )
-
-    builder.add_description("Examples:").add_command(
-        "arda theme list", "List all available themes", option_style
-    ).add_command(
-        "arda --theme nord preview", "Preview the nord theme", option_style
-    ).add_command(
-        "arda theme preview", "Preview the current theme", option_style
-    ).add_spacer().add_description("To preview a different theme:").add_command(
-        "arda --theme <name> preview", "Preview a specific theme", option_style
-    ).add_spacer().add_description("To change the theme permanently:").add_command(
-        "arda config set theme <theme>", "Set in project config", option_style
-    ).add_command(
-        "arda config --global set theme <theme>", "Set in user config", option_style
-    )
-
-    panel = builder.build()
-    console = Console()
+    # Rich's shared console, as show_command_help uses for the same output
+    console = get_console()
     console.print(panel)
 
     # Show active config (blank line before and after, matching arda --help)
-    from arda_cli.lib.config import get_active_config_path
-
     _config_path, config_source = get_active_config_path()
 
     # Get colors directly from the theme configuration
@@ -76,7 +67,14 @@ def theme_help_callback(
     ctx.exit()
 
 
-@rclick.group(invoke_without_command=True)
+# Sub-commands, imported only when they're used
+_SUBCOMMANDS = {
+    "list": "arda_cli.commands.theme.list:list",
+    "preview": "arda_cli.commands.theme.preview:preview",
+}
+
+
+@rclick.group(cls=LazyGroup, lazy_subcommands=_SUBCOMMANDS, invoke_without_command=True)
 @click.option(
     "--help",
     is_flag=True,
@@ -99,8 +97,3 @@ def theme(ctx: click.Context) -> None:
     if ctx.invoked_subcommand is None:
         show_theme_help(ctx)
         ctx.exit()
-
-
-# Register sub-commands
-theme.add_command(list)
-theme.add_command(preview)
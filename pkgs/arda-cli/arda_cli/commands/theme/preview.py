@@ -23,81 +23,62 @@ def preview(ctx: click.Context) -> None:
     # Get the current theme from context
     preview_theme = ctx.obj["theme"]
 
-    # Verbose configuration info
-    if output.verbose:
-        output.trace("Theme configuration:")
-        output.debug(f"Current theme: {preview_theme}")
-        output.debug(f"Verbose mode: {output.verbose}")
-        output.debug(f"Timestamp enabled: {output.timestamps}")
+    # Rich buffers everything printed inside this block and writes it out
+    # in one go when the block ends, instead of once per print
+    with output.console:
+        # Verbose configuration info
+        if output.verbose:
+            output.trace("Theme configuration:")
+            output.debug(f"Current theme: {preview_theme}")
+            output.debug(f"Verbose mode: {output.verbose}")
+            output.debug(f"Timestamp enabled: {output.timestamps}")
+            output.spacer()
+
+        # Section header for top section
+        output.section("Theme Info")
+
+        # Current theme and instructions, printed as one block
+        text = output.colors["text"]
+        separator_text = output.colors["separator_text"]
+        output.console.print(
+            f"[{text}]Current Theme:[/{text}] "
+            f"[{separator_text}]{preview_theme.upper()}[/{separator_text}]\n"
+            "\n"
+            f"[{text}]Preview a different theme:[/{text}]\n"
+            "  [command]arda --theme <name> preview[/command]\n"
+            "\n"
+            f"[{text}]To see all available themes:[/{text}]\n"
+            "  [command]arda theme list[/command]\n"
+        )
+
+        # Section 1: Message Types (no timestamps)
+        output.section("Message Types")
+
+        # Timestamps are off for this section, whatever the setting
+        with output.use_timestamps(False):
+            output.info("Information")
+            output.success("Success message")
+            output.warning("Warning message")
+            output.error("Error message")
         output.spacer()
 
-    # Section header for top section
-    output.section("Theme Info")
-
-    # First line: Current Theme
-    # Print with custom formatting to match original
-    output.console.print(
-        f"[{output.colors['text']}]Current Theme:[/{output.colors['text']}] "
-        f"[{output.colors['separator_text']}]{preview_theme.upper()}"
-        f"[/{output.colors['separator_text']}]"
-    )
-    output.spacer()
-
-    # Instructions
-    output.console.print(
-        f"[{output.colors['text']}]Preview a different theme:[/{output.colors['text']}]"
-    )
-    output.console.print("  [command]arda --theme <name> preview[/command]")
-    output.spacer()
-    output.console.print(
-        f"[{output.colors['text']}]"
-        f"To see all available themes:[/{output.colors['text']}]"
-    )
-    output.console.print("  [command]arda theme list[/command]")
-    output.spacer()
-
-    # Section 1: Message Types (no timestamps)
-    output.section("Message Types")
-
-    # Temporarily disable timestamps for this section
-    original_timestamps = output.timestamps
-    output.timestamps = False
-
-    output.info("Information")
-    output.success("Success message")
-    output.warning("Warning message")
-    output.error("Error message")
-
-    # Restore original timestamp setting
-    output.timestamps = original_timestamps
-    output.spacer()
-
-    # Section 2: Message Types With Timestamps
-    output.section("Message Types With Timestamps")
-
-    # Temporarily enable timestamps for these examples
-    output.timestamps = True
-
-    output.info("Information")
-    output.success("Success message")
-    output.warning("Warning message")
-    output.error("Error message")
-
-    # Restore original timestamp setting
-    output.timestamps = original_timestamps
-    output.spacer()
-
-    # Section 3: Example Help
-    output.section("Example Help")
-    output.spacer()
-
-    # Walk up to parent context
-    parent_ctx = ctx
-    while parent_ctx.parent is not None:
-        parent_ctx = parent_ctx.parent
-
-    # Get help text using the parent context's get_help() method
-    help_text = parent_ctx.get_help()
+        # Section 2: Message Types With Timestamps
+        output.section("Message Types With Timestamps")
+
+        # Timestamps are on for these examples, whatever the setting
+        with output.use_timestamps(True):
+            output.info("Information")
+            output.success("Success message")
+            output.warning("Warning message")
+            output.error("Error message")
+        output.spacer()
+
+        # Section 3: Example Help
+        output.section("Example Help")
+        output.spacer()
+
+    # Get help text using the root context's get_help() method
+    help_text = ctx.find_root().get_help()
 
     # Print help text directly to preserve ANSI codes
     sys.stdout.write(help_text)
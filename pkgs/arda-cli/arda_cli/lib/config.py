@@ -1,16 +1,70 @@
 """Configuration file handling for Arda CLI."""
 
+import copy
+import functools
 import tomllib
 from pathlib import Path
-
-try:
-    import tomli_w  # type: ignore
-except ImportError:
-    # Fallback for environments without tomli_w (until devShell is activated)
-    import toml as tomli_w
+from typing import NamedTuple
 
 DEFAULT_CONFIG_NAME = "arda.toml"
 
+# Every (section, setting) pair a config file may set
+VALID_CONFIG_KEYS = frozenset(
+    {
+        ("theme", "default"),
+        ("output", "verbose"),
+        ("output", "timestamp"),
+    }
+)
+
+# Config locations relative to the working directory and the home directory
+_PROJECT_CONFIG_SUFFIX = Path("etc", DEFAULT_CONFIG_NAME)
+_XDG_CONFIG_SUFFIX = Path(".config", "arda", DEFAULT_CONFIG_NAME)
+
+
+def _project_config_path() -> Path:
+    """Get the project-level config path (etc/arda.toml in the cwd)."""
+    return Path.cwd() / _PROJECT_CONFIG_SUFFIX
+
+
+def _xdg_config_path() -> Path:
+    """Get the XDG user config path (~/.config/arda/arda.toml)."""
+    return Path.home() / _XDG_CONFIG_SUFFIX
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_toml_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML file, memoized on its path, mtime and size.
+
+    The mtime and size are part of the cache key so that an edited file is
+    re-parsed on the next read.
+    """
+    # Config files are tiny: one read into memory beats streaming the parse
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _read_toml(path: Path) -> dict:
+    """Read a TOML file through the in-process parse cache.
+
+    Args:
+        path: Path to the TOML file
+
+    Returns:
+        A private copy of the parsed data, safe for the caller to mutate
+
+    Raises:
+        OSError: If the file can't be read
+        tomllib.TOMLDecodeError: If the file isn't valid TOML
+
+    """
+    st = path.stat()
+    return copy.deepcopy(_parse_toml_file(str(path), st.st_mtime_ns, st.st_size))
+
+
+def clear_config_cache() -> None:
+    """Drop all cached TOML parse results."""
+    _parse_toml_file.cache_clear()
+
 
 def get_active_config_path() -> tuple[Path | None, str]:
     """Get the path to the active configuration file.
@@ -27,12 +81,12 @@ def get_active_config_path() -> tuple[Path | None, str]:
 
     """
     # Project-level config (highest priority)
-    project_config = Path.cwd() / "etc" / DEFAULT_CONFIG_NAME
+    project_config = _project_config_path()
     if project_config.exists():
         return (project_config, str(project_config))
 
     # XDG user config (medium priority)
-    xdg_config = Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME
+    xdg_config = _xdg_config_path()
     if xdg_config.exists():
         return (xdg_config, str(xdg_config))
 
@@ -40,6 +94,19 @@ def get_active_config_path() -> tuple[Path | None, str]:
     return (None, "package defaults")
 
 
+def _config_search_paths() -> list[Path]:
+    """Get the config file candidates in search order (highest priority first)."""
+    cwd = Path.cwd()
+    return [
+        # Project-level config - highest priority
+        cwd / _PROJECT_CONFIG_SUFFIX,
+        # XDG config directory (user-level) - medium priority
+        _xdg_config_path(),
+        # Current directory
+        cwd / DEFAULT_CONFIG_NAME,
+    ]
+
+
 def get_config_path() -> Path | None:
     """Find the first existing config file in search paths.
 
@@ -53,18 +120,8 @@ def get_config_path() -> Path | None:
     4. ./arda_cli/arda.toml (package default/fallback)
 
     """
-    # Define search paths in priority order (highest to lowest)
-    search_paths = [
-        # Project-level config - highest priority
-        Path.cwd() / "etc" / DEFAULT_CONFIG_NAME,
-        # XDG config directory (user-level) - medium priority
-        Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME,
-        # Current directory
-        Path.cwd() / DEFAULT_CONFIG_NAME,
-    ]
-
     # Find first existing config
-    for config_path in search_paths:
+    for config_path in _config_search_paths():
         if config_path.exists():
             return config_path
 
@@ -80,17 +137,18 @@ def load_config() -> dict:
         Dictionary containing config settings
 
     """
-    config_path = get_config_path()
-
-    if config_path and config_path.exists():
+    # Try each candidate directly instead of probing it first: a missing
+    # file costs one failed stat, and an existing one isn't stat'ed twice
+    for config_path in _config_search_paths():
         try:
-            with open(config_path, "rb") as f:
-                return tomllib.load(f)
+            return _read_toml(config_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
         except Exception:
             # Silently fall back to default config
             return load_default_config()
-    else:
-        return load_default_config()
+
+    return load_default_config()
 
 
 def load_default_config() -> dict:
@@ -100,37 +158,52 @@ def load_default_config() -> dict:
         Dictionary containing default config
 
     """
-    # Get the path to the default config file in the package
-    package_dir = Path(__file__).parent.parent
-    default_config_path = package_dir / DEFAULT_CONFIG_NAME
-
-    if default_config_path.exists():
-        with open(default_config_path, "rb") as f:
-            return tomllib.load(f)
-
-    # Return hardcoded default if file doesn't exist
-    return {
-        "theme": {"default": "forest"},
-        "output": {"verbose": False, "timestamp": True},
-    }
+    # Defaults are precompiled from arda.toml, so there's nothing to parse
+    from arda_cli._default_config import DEFAULT_CONFIG
 
+    return copy.deepcopy(DEFAULT_CONFIG)
 
-def get_theme_from_config() -> str:
-    """Get the theme setting from config file.
+
+class ConfigValues(NamedTuple):
+    """The theme, verbose and timestamp settings read from config."""
+
+    theme: str
+    verbose: bool
+    timestamp: bool
+
+
+def get_config_values() -> ConfigValues:
+    """Get the theme, verbose and timestamp settings with a single config load.
 
     Returns:
-        Theme name string (default: "dracula")
+        ConfigValues(theme, verbose, timestamp), each falling back to its
+        default (dracula, False, True) when not set
 
     """
     config = load_config()
 
-    # Try to get theme from config
-    if "theme" in config:
-        theme_config = config["theme"]
-        if "default" in theme_config:
-            return str(theme_config["default"])
+    theme_config = config.get("theme")
+    if not isinstance(theme_config, dict):
+        theme_config = {}
+    output_config = config.get("output")
+    if not isinstance(output_config, dict):
+        output_config = {}
 
-    return "dracula"
+    return ConfigValues(
+        theme=str(theme_config.get("default", "dracula")),
+        verbose=bool(output_config.get("verbose", False)),
+        timestamp=bool(output_config.get("timestamp", True)),
+    )
+
+
+def get_theme_from_config() -> str:
+    """Get the theme setting from config file.
+
+    Returns:
+        Theme name string (default: "dracula")
+
+    """
+    return get_config_values().theme
 
 
 def get_verbose_from_config() -> bool:
@@ -140,15 +213,7 @@ def get_verbose_from_config() -> bool:
         Verbose setting (default: False)
 
     """
-    config = load_config()
-
-    # Try to get verbose from config
-    if "output" in config:
-        output_config = config["output"]
-        if "verbose" in output_config:
-            return bool(output_config["verbose"])
-
-    return False
+    return get_config_values().verbose
 
 
 def get_timestamp_from_config() -> bool:
@@ -158,15 +223,7 @@ def get_timestamp_from_config() -> bool:
         Timestamp setting (default: True)
 
     """
-    config = load_config()
-
-    # Try to get timestamp from config
-    if "output" in config:
-        output_config = config["output"]
-        if "timestamp" in output_config:
-            return bool(output_config["timestamp"])
-
-    return True
+    return get_config_values().timestamp
 
 
 def get_config_for_viewing(
@@ -195,34 +252,38 @@ def get_config_for_viewing(
     # Add paths based on force flags
     if force_local:
         # Only read from project config
-        project_config = Path.cwd() / "etc" / DEFAULT_CONFIG_NAME
+        project_config = _project_config_path()
         search_paths.append(project_config)
     elif force_global:
         # Only read from XDG config
-        xdg_config = Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME
+        xdg_config = _xdg_config_path()
         search_paths.append(xdg_config)
     else:
         # Normal priority order (project → XDG → package defaults)
         search_paths = [
             # XDG config directory (user-level) - medium priority
-            Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME,
+            _xdg_config_path(),
             # Project-level config - highest priority
-            Path.cwd() / "etc" / DEFAULT_CONFIG_NAME,
+            _project_config_path(),
         ]
 
     # Merge configs in reverse order (lowest to highest priority)
     merged_config: dict = {}
 
     for config_path in search_paths:
-        if config_path.exists():
-            try:
-                with open(config_path, "rb") as f:
-                    config_data = tomllib.load(f)
-                    # Merge with higher priority overriding lower
-                    merged_config = _deep_merge(merged_config, config_data)
-            except OSError:
-                # Skip invalid or unreadable config files
-                pass
+        try:
+            config_data = _read_toml(config_path)
+        except OSError:
+            # Skip missing or unreadable config files (reading directly
+            # instead of checking exists() first saves a stat per file)
+            continue
+        if not merged_config:
+            # Nothing to merge into yet (the common single-file case)
+            merged_config = config_data
+        else:
+            # Merge with higher priority overriding lower; both dicts are
+            # private copies, so the merge can update in place
+            merged_config = _deep_merge(merged_config, config_data)
 
     # If no configs found, return package defaults (never read package config directly)
     if not merged_config:
@@ -255,26 +316,26 @@ def get_config_for_writing(
     # Determine which config to use based on force flags
     if force_local:
         # Force project config
-        project_config = Path.cwd() / "etc" / DEFAULT_CONFIG_NAME
+        project_config = _project_config_path()
         project_config.parent.mkdir(parents=True, exist_ok=True)
         return project_config
 
     elif force_global:
         # Force XDG config
-        xdg_config = Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME
+        xdg_config = _xdg_config_path()
         xdg_config.parent.mkdir(parents=True, exist_ok=True)
         return xdg_config
 
     else:
         # Default priority: project config takes precedence
-        project_config = Path.cwd() / "etc" / DEFAULT_CONFIG_NAME
+        project_config = _project_config_path()
 
         # If project config exists, use it
         if project_config.exists():
             return project_config
 
         # Otherwise, fall back to XDG config
-        xdg_config = Path.home() / ".config" / "arda" / DEFAULT_CONFIG_NAME
+        xdg_config = _xdg_config_path()
 
         # Create XDG directory if it doesn't exist
         xdg_config.parent.mkdir(parents=True, exist_ok=True)
@@ -298,16 +359,14 @@ def set_config_value(
 
     """
     # Load existing config or start with defaults
-    if config_path.exists():
-        try:
-            with open(config_path, "rb") as f:
-                config_data = tomllib.load(f)
-        except Exception:
-            # If file exists but can't be read, start fresh
-            config_data = {}
-    else:
+    try:
+        config_data = _read_toml(config_path)
+    except (FileNotFoundError, NotADirectoryError):
         # If file doesn't exist, start with package defaults
         config_data = load_default_config()
+    except Exception:
+        # If file exists but can't be read, start fresh
+        config_data = {}
 
     # Ensure section exists
     if section not in config_data:
@@ -322,47 +381,54 @@ def set_config_value(
     # Create parent directory if it doesn't exist
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write back to file
-    # Check if we're using tomli_w (binary mode) or toml (text mode)
-    if tomli_w.__name__ == "tomli_w":
-        # tomli_w requires binary mode
-        with open(config_path, "wb") as f:
-            tomli_w.dump(config_data, f)
-    else:
-        # toml module requires text mode
-        with open(config_path, "w", encoding="utf-8") as f:
-            tomli_w.dump(config_data, f)
+    # Only writes need a TOML writer, so it isn't imported for every read
+    try:
+        import tomli_w  # type: ignore
+    except ImportError:
+        # Fallback for environments without tomli_w (until devShell is activated)
+        import toml as tomli_w
+
+    # Write back to file in a single write (tomli_w and toml both
+    # provide dumps() returning str)
+    config_path.write_text(tomli_w.dumps(config_data), encoding="utf-8")
+
+    # The file changed on disk; don't serve the old parse from the cache
+    clear_config_cache()
 
 
-def get_valid_config_keys() -> list[tuple[str, str]]:
-    """Get list of all valid configuration keys.
+def get_valid_config_keys() -> frozenset[tuple[str, str]]:
+    """Get the set of all valid configuration keys.
 
     Returns:
-        List of (section, setting) tuples representing valid configuration keys
+        Frozen set of (section, setting) tuples representing valid
+        configuration keys, for O(1) membership checks
 
     """
-    return [
-        ("theme", "default"),
-        ("output", "verbose"),
-        ("output", "timestamp"),
-    ]
+    return VALID_CONFIG_KEYS
 
 
 def _deep_merge(base: dict, update: dict) -> dict:
-    """Recursively merge two dictionaries.
+    """Merge update into base in place, recursing into nested dictionaries.
+
+    Nested dictionaries from update may end up shared with base, so neither
+    argument should be used by the caller afterwards except through the
+    returned dictionary.
 
     Args:
-        base: Base dictionary
+        base: Base dictionary (modified)
         update: Dictionary to merge into base
 
     Returns:
-        Merged dictionary
+        The merged base dictionary
 
     """
-    result = base.copy()
-    for key, value in update.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    stack = [(base, update)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
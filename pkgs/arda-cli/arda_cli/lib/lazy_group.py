@@ -0,0 +1,45 @@
+"""Click group that imports its subcommands on first use.
+
+Each subcommand is registered as an import path instead of a command
+object, so running one command doesn't import the modules (and their
+dependencies) of all the others.
+"""
+
+import importlib
+from typing import Any
+
+import click
+import rich_click as rclick
+
+
+class LazyGroup(rclick.RichGroup):
+    """RichGroup whose subcommands are imported when first looked up.
+
+    Args:
+        lazy_subcommands: Mapping of command name to "module.path:attribute"
+
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create the group with its lazily imported subcommands."""
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List loaded and not-yet-loaded subcommands, sorted by name."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a subcommand, importing it on first use."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            # Registering it keeps rich-click's help rendering, which reads
+            # self.commands directly, working as for eagerly added commands
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -6,10 +6,11 @@ including themes, verbosity levels, tags, timestamps, and debugging features.
 
 from __future__ import annotations
 
+import functools
+import os
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
@@ -23,6 +24,33 @@ from rich_click.rich_help_configuration import RichHelpConfiguration
 # Import from compatibility layer for Rich API compatibility
 from arda_cli.lib.rich_compat import get_console, get_text_plain
 
+# ============================================================================
+# THEME CONFIGURATION
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_help_config(theme: str, env_theme: str | None) -> RichHelpConfiguration:
+    """Build a RichHelpConfiguration (memoized by get_help_config)."""
+    return RichHelpConfiguration(theme=theme, enable_theme_env_var=True)
+
+
+def get_help_config(theme: str) -> RichHelpConfiguration:
+    """Get the rich-click help configuration for a theme.
+
+    Building a RichHelpConfiguration resolves the whole theme, so the result
+    is memoized. RICH_CLICK_THEME is part of the cache key because
+    enable_theme_env_var lets it override the requested theme.
+
+    Args:
+        theme: Theme name (e.g., 'nord', 'dracula', 'forest')
+
+    Returns:
+        RichHelpConfiguration for the theme (shared; don't mutate it)
+
+    """
+    return _cached_help_config(theme, os.environ.get("RICH_CLICK_THEME"))
+
 
 class VerbosityLevel(Enum):
     """Verbosity levels for different output detail.
@@ -90,6 +118,31 @@ class OutputManager:
         # Load theme colors
         self.colors = self._load_theme_colors()
 
+        # Timestamp markup around the time itself never changes, so it is
+        # built once instead of for every message
+        timestamp_color = self.colors["timestamp"]
+        self._timestamp_prefix = f"[{timestamp_color}]["
+        self._timestamp_suffix = f"][/{timestamp_color}] "
+
+        # Bracket markup around tags and section titles, built once
+        bracket_color = self.colors["tag_brackets"]
+        self._tag_open = f"[{bracket_color}][[/{bracket_color}]"
+        self._tag_close = f"[{bracket_color}]][/{bracket_color}]"
+        separator = self.colors["separator"]
+        separator_text = self.colors["separator_text"]
+        self._title_open = f"[{separator}][[{separator_text}]"
+        self._title_close = f"[/{separator_text}]][/{separator}]"
+
+        # Tags of the fixed message types, formatted once instead of for
+        # every message
+        self._tags = {
+            "INFO": self._format_tag("INFO", self.colors["tag_info"]),
+            "SUCCESS": self._format_tag("SUCCESS", self.colors["tag_success"]),
+            "WARN": self._format_tag("WARN", self.colors["tag_warning"]),
+            "ERROR": self._format_tag("ERROR", self.colors["tag_error"]),
+            "DEBUG": self._format_tag("DEBUG", self.colors["tag_debug"]),
+        }
+
         # Step counter for step tracking
         self._step_counter = 0
 
@@ -109,7 +162,7 @@ class OutputManager:
             return
 
         timestamp = self._get_timestamp()
-        tag = self._format_tag("INFO", self.colors["tag_info"])
+        tag = self._tags["INFO"]
         self._print_line(timestamp, tag, message)
 
     def success(self, message: str, verbose_only: bool = False) -> None:
@@ -124,7 +177,7 @@ class OutputManager:
             return
 
         timestamp = self._get_timestamp()
-        tag = self._format_tag("SUCCESS", self.colors["tag_success"])
+        tag = self._tags["SUCCESS"]
         self._print_line(timestamp, tag, message)
 
     def warning(self, message: str, verbose_only: bool = False) -> None:
@@ -139,7 +192,7 @@ class OutputManager:
             return
 
         timestamp = self._get_timestamp()
-        tag = self._format_tag("WARN", self.colors["tag_warning"])
+        tag = self._tags["WARN"]
         self._print_line(timestamp, tag, message)
 
     def error(self, message: str, verbose_only: bool = False) -> None:
@@ -154,7 +207,7 @@ class OutputManager:
             return
 
         timestamp = self._get_timestamp()
-        tag = self._format_tag("ERROR", self.colors["tag_error"])
+        tag = self._tags["ERROR"]
         self._print_line(timestamp, tag, message)
 
     def debug(self, message: str) -> None:
@@ -168,7 +221,7 @@ class OutputManager:
             return
 
         timestamp = self._get_timestamp()
-        tag = self._format_tag("DEBUG", self.colors["tag_debug"])
+        tag = self._tags["DEBUG"]
         self._print_line(timestamp, tag, message)
 
     # ============================================================================
@@ -184,12 +237,7 @@ class OutputManager:
         """
         if title:
             # Wrap title in brackets (preserve aesthetic preference)
-            title_with_brackets = (
-                f"[{self.colors['separator']}][[{self.colors['separator']}]"
-                f"[{self.colors['separator_text']}]{title}"
-                f"[/{self.colors['separator_text']}]"
-                f"[{self.colors['separator']}]][/{self.colors['separator']}]"
-            )
+            title_with_brackets = f"{self._title_open}{title}{self._title_close}"
             separator = Rule(
                 title=title_with_brackets,
                 style=self.colors["separator"],
@@ -334,6 +382,25 @@ class OutputManager:
             self.debug(f"✗ {operation} failed after {duration:.3f}s: {e}")
             raise
 
+    @contextmanager
+    def use_timestamps(self, enabled: bool) -> Generator[None, None, None]:
+        """Temporarily turn timestamps on or off.
+
+        Args:
+            enabled: Whether messages inside the block get timestamps
+
+        Example:
+            with output.use_timestamps(False):
+                output.info("Shown without a timestamp")
+
+        """
+        original = self.timestamps
+        self.timestamps = enabled
+        try:
+            yield
+        finally:
+            self.timestamps = original
+
     def print_header(self, text: str, border_style: str | None = None) -> None:
         """Print a header with a bordered panel.
 
@@ -366,13 +433,9 @@ class OutputManager:
         if not self.timestamps:
             return ""
 
-        timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        timestamp_color = self.colors["timestamp"]
-        return (
-            f"[{timestamp_color}][[/{timestamp_color}]"
-            f"[{timestamp_color}]{timestamp_str}[/{timestamp_color}]"
-            f"[{timestamp_color}]][/{timestamp_color}] "
-        )
+        # time.strftime formats the local time without a datetime object
+        timestamp_str = time.strftime("%Y-%m-%d %H:%M:%S")
+        return f"{self._timestamp_prefix}{timestamp_str}{self._timestamp_suffix}"
 
     def _format_tag(self, tag_content: str, color: str) -> str:
         """Format tag with square brackets.
@@ -385,11 +448,9 @@ class OutputManager:
             Formatted tag string with square brackets
 
         """
-        bracket_color = self.colors["tag_brackets"]
         return (
-            f"[{bracket_color}][[/{bracket_color}]"
-            f"[bold {color}]{tag_content}[/bold {color}]"
-            f"[{bracket_color}]][/{bracket_color}]"
+            f"{self._tag_open}[bold {color}]{tag_content}[/bold {color}]"
+            f"{self._tag_close}"
         )
 
     def _print_line(
@@ -416,10 +477,8 @@ class OutputManager:
             Dictionary mapping color names to color values
 
         """
-        config = RichHelpConfiguration(
-            theme=self.theme,
-            enable_theme_env_var=True,
-        )
+        # Resolved themes are memoized, so each theme is only built once
+        config = get_help_config(self.theme)
 
         return {
             # Tags
@@ -660,6 +719,46 @@ class ExtraHelpPanelBuilder:
         )
 
 
+@functools.lru_cache(maxsize=16)
+def build_extra_help_panel(
+    items: tuple[tuple[str, str] | str, ...],
+    theme_name: str,
+    helptext_style: str,
+    option_style: str,
+) -> Panel:
+    """Build an "Extra Help" panel from a static description of its content.
+
+    Each item is a (command, comment) pair, a description line, or "" for
+    a blank line. A command's panel content is static for a given theme,
+    so the panel is built once and reused; rich renderables aren't
+    modified by printing.
+
+    Args:
+        items: Panel content, in display order
+        theme_name: Theme name used for the panel border and title
+        helptext_style: Style for description lines
+        option_style: Style for commands
+
+    Returns:
+        Panel widget ready to print
+
+    """
+    builder = ExtraHelpPanelBuilder(
+        title="Extra Help",
+        theme=theme_name,
+        helptext_style=helptext_style,
+    )
+    for item in items:
+        if isinstance(item, tuple):
+            command, comment = item
+            builder.add_command(command, comment, option_style)
+        elif item:
+            builder.add_description(item)
+        else:
+            builder.add_spacer()
+    return builder.build()
+
+
 # ============================================================================
 # ALIGNMENT HELPERS
 # ============================================================================
@@ -785,7 +884,7 @@ def create_extra_help_panel(
 
     # Get theme colors for the panel
     try:
-        config = RichHelpConfiguration(theme=theme, enable_theme_env_var=True)
+        config = get_help_config(theme)
         border_color = str(
             config.style_options_panel_border
             or config.style_commands_panel_border
@@ -896,11 +995,11 @@ def create_error_panel(
     # Get the theme's error border color
     # Handle invalid themes by falling back to dracula
     try:
-        config = RichHelpConfiguration(theme=theme, enable_theme_env_var=True)
+        config = get_help_config(theme)
         error_border_color = str(config.style_errors_panel_border or "red")
     except Exception:
         # Invalid theme - fall back to dracula's error color
-        config = RichHelpConfiguration(theme="dracula", enable_theme_env_var=True)
+        config = get_help_config("dracula")
         error_border_color = str(config.style_errors_panel_border or "red")
 
     return Panel(
@@ -918,8 +1017,6 @@ def show_command_help(ctx: click.Context) -> None:
     click.echo(ctx.get_help())
 
     # Show active config (blank line before and after, matching arda --help)
-    from rich_click.rich_help_configuration import RichHelpConfiguration
-
     from arda_cli.lib.config import get_active_config_path
 
     _config_path, config_source = get_active_config_path()
@@ -930,7 +1027,7 @@ def show_command_help(ctx: click.Context) -> None:
         if ctx.obj and isinstance(ctx.obj, dict)
         else "dracula"
     )
-    config = RichHelpConfiguration(theme=theme_name, enable_theme_env_var=True)
+    config = get_help_config(theme_name)
 
     # Get colors directly from the theme configuration
     label_style = str(config.style_option or "dim")  # Use option style for the label
@@ -0,0 +1,51 @@
+"""Factory for commands whose features haven't been built yet.
+
+Placeholder commands share the same shape: with or without --help, they
+show their themed help and the active configuration.
+"""
+
+import click
+import rich_click as rclick
+
+from arda_cli.lib.output import show_command_help
+
+
+def placeholder_help_callback(
+    ctx: click.Context, param: click.Parameter, value: bool
+) -> None:
+    """Show help with active configuration."""
+    if not value:
+        return
+    show_command_help(ctx)
+    ctx.exit()
+
+
+def make_placeholder_command(name: str, help: str) -> click.Command:
+    """Build a placeholder command.
+
+    Args:
+        name: Command name
+        help: Help text shown for the command
+
+    Returns:
+        The rich-click command
+
+    """
+
+    def placeholder(ctx: click.Context) -> None:
+        # Nothing to run yet, so show help (matching arda --help)
+        show_command_help(ctx)
+        ctx.exit()
+
+    placeholder.__name__ = name
+
+    return rclick.command(name=name, help=help)(
+        click.option(
+            "--help",
+            is_flag=True,
+            is_eager=True,
+            expose_value=False,
+            callback=placeholder_help_callback,
+            help="Show this help message and exit.",
+        )(click.pass_context(placeholder))
+    )
@@ -1,5 +1,6 @@
 """Theme handling for rich-click integration."""
 
+import functools
 import os
 import sys
 
@@ -62,8 +63,13 @@ else:
     _GLOBAL_THEME = get_theme_from_config()
 
 
-def get_rich_click_themes() -> list[str]:
-    """Get list of available rich-click themes."""
+@functools.cache
+def get_rich_click_themes() -> tuple[str, ...]:
+    """Get the available rich-click themes.
+
+    The list is fixed, so it is built once and returned as a tuple that
+    callers can't mutate.
+    """
     # All available rich-click color palettes
     palettes = [
         "default",
@@ -115,7 +121,7 @@ def get_rich_click_themes() -> list[str]:
             for fmt in ["slim", "modern", "nu", "robo"]:
                 themes.append(f"{palette}-{fmt}")
 
-    return themes
+    return tuple(themes)
 
 
 def patch_rich_click() -> None:
@@ -12,27 +12,15 @@ import rich_click as rclick
 from rich.console import Console
 from rich.panel import Panel
 
-# Import tomli_w conditionally (for config file creation)
-try:
-    import tomli_w
-except ImportError:
-    # tomli_w may not be available in all environments
-    tomli_w = None
-
-# Import commands from commands/ directory
-from arda_cli.commands.config.main import config
-from arda_cli.commands.flakes.main import flakes
-from arda_cli.commands.host.main import host
-from arda_cli.commands.roles.main import roles
-from arda_cli.commands.secrets.main import secrets
-from arda_cli.commands.theme.main import theme
 from arda_cli.lib.config import (
+    ConfigValues,
     get_active_config_path,
+    get_config_values,
     get_theme_from_config,
-    get_timestamp_from_config,
-    get_verbose_from_config,
 )
-from arda_cli.lib.output import create_error_panel
+from arda_cli.lib.lazy_group import LazyGroup
+from arda_cli.lib.output import create_error_panel, get_help_config
+from arda_cli.lib.rich_compat import get_console
 
 # Import theme handling from lib
 from arda_cli.lib.theme import get_rich_click_themes, patch_rich_click
@@ -43,25 +31,21 @@ warnings.filterwarnings("ignore", message="RichClickTheme.*not found")
 # Patch click with theme configuration
 patch_rich_click()
 
+# Lowercased theme names, for case-insensitive validation of --theme
+_THEME_NAMES = frozenset(theme.lower() for theme in get_rich_click_themes())
+
 
 # Module-level defaults - computed lazily to avoid test pollution
 # These values are computed on first module import and then cached.
 # In tests, they can be reset by clearing _default_config_cache.
-def _get_default_config() -> tuple[str, bool, bool]:
+def _get_default_config() -> ConfigValues:
     """Get default config values from config files or defaults."""
-    from arda_cli.lib.config import (
-        get_theme_from_config,
-    )
-
-    return (
-        get_theme_from_config(),
-        get_verbose_from_config(),
-        get_timestamp_from_config(),
-    )
+    # One config load for all three settings
+    return get_config_values()
 
 
 # Cache for default config values (None = not yet computed)
-_default_config_cache: tuple[str, bool, bool] | None = None
+_default_config_cache: ConfigValues | None = None
 
 
 def _get_default_theme() -> str:
@@ -69,7 +53,7 @@ def _get_default_theme() -> str:
     global _default_config_cache
     if _default_config_cache is None:
         _default_config_cache = _get_default_config()
-    return _default_config_cache[0]
+    return _default_config_cache.theme
 
 
 def _get_default_verbose() -> bool:
@@ -77,7 +61,7 @@ def _get_default_verbose() -> bool:
     global _default_config_cache
     if _default_config_cache is None:
         _default_config_cache = _get_default_config()
-    return _default_config_cache[1]
+    return _default_config_cache.verbose
 
 
 def _get_default_timestamp() -> bool:
@@ -85,7 +69,7 @@ def _get_default_timestamp() -> bool:
     global _default_config_cache
     if _default_config_cache is None:
         _default_config_cache = _get_default_config()
-    return _default_config_cache[2]
+    return _default_config_cache.timestamp
 
 
 def reset_default_config_cache() -> None:
@@ -122,7 +106,10 @@ def ensure_config_exists() -> None:
         # Ensure etc directory exists
         project_config.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create config with defaults
+        # Create config with defaults (tomli_w is only needed here, so it
+        # stays off the startup path of every other command)
+        import tomli_w
+
         from arda_cli.lib.config import load_default_config
 
         default_config = load_default_config()
@@ -153,12 +140,10 @@ def validate_theme(ctx: click.Context, param: click.Parameter, value: str) -> st
     if value is None:
         return value
 
-    available_themes = get_rich_click_themes()
-    if value.lower() not in [t.lower() for t in available_themes]:
+    if value.lower() not in _THEME_NAMES:
         # Create custom error with rich Text markup
         from rich.console import Console
         from rich.text import Text
-        from rich_click.rich_help_configuration import RichHelpConfiguration
 
         console = Console(stderr=True, force_terminal=True)
 
@@ -166,7 +151,7 @@ def validate_theme(ctx: click.Context, param: click.Parameter, value: str) -> st
         theme = get_theme_from_config()
 
         # Load theme colors for message styling
-        config = RichHelpConfiguration(theme=theme, enable_theme_env_var=True)
+        config = get_help_config(theme)
 
         # Use theme-appropriate colors
         error_text_color = str(config.style_option or "cyan")
@@ -218,8 +203,7 @@ def show_help_with_config(
         theme = get_theme_from_config()
 
     # Validate theme before showing help
-    available_themes = get_rich_click_themes()
-    if theme.lower() not in [t.lower() for t in available_themes]:
+    if theme.lower() not in _THEME_NAMES:
         # Create custom error with rich Text markup
         from rich.text import Text
 
@@ -243,15 +227,13 @@ def show_help_with_config(
     click.echo(ctx.get_help())
 
     # Get colors directly from the theme configuration
-    from rich_click.rich_help_configuration import RichHelpConfiguration
-
-    config = RichHelpConfiguration(theme=theme, enable_theme_env_var=True)
+    config = get_help_config(theme)
     label_style = str(config.style_option or "dim")  # Use option style for the label
     path_style = str(config.style_command or "white")  # Use command style for the path
 
     # Then show active configuration
     _config_path, config_source = get_active_config_path()
-    console = Console()
+    console = get_console()
     console.print(
         f"\n[{label_style}]Active configuration:[/] "
         f"[{path_style}]{config_source}[/{path_style}]\n"
@@ -272,14 +254,22 @@ def show_version(ctx: click.Context, param: click.Parameter, value: bool) -> Non
         package_version = "unknown"
 
     # Display version with rich formatting
-    from rich.console import Console
-
-    console = Console()
-    console.print(f"Arda CLI version: {package_version}")
+    get_console().print(f"Arda CLI version: {package_version}")
     ctx.exit(0)
 
 
-@rclick.group(invoke_without_command=True)
+# Commands from commands/ directory, imported only when they're used
+_COMMANDS = {
+    "config": "arda_cli.commands.config.main:config",
+    "flakes": "arda_cli.commands.flakes.main:flakes",
+    "host": "arda_cli.commands.host.main:host",
+    "roles": "arda_cli.commands.roles.main:roles",
+    "secrets": "arda_cli.commands.secrets.main:secrets",
+    "theme": "arda_cli.commands.theme.main:theme",
+}
+
+
+@rclick.group(cls=LazyGroup, lazy_subcommands=_COMMANDS, invoke_without_command=True)
 @click.option(
     "--theme",
     type=str,
@@ -353,15 +343,6 @@ def main(ctx: click.Context, theme: str, verbose: bool, timestamp: bool) -> None
         show_help_with_config(ctx, None, True)
 
 
-# Register commands with the main group
-main.add_command(config)
-main.add_command(flakes)
-main.add_command(host)
-main.add_command(roles)
-main.add_command(secrets)
-main.add_command(theme)
-
-
 if __name__ == "__main__":
     main()
 # test
@@ -5,10 +5,11 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from arda_cli.lib.config import get_active_config_path
+from arda_cli.lib.config import ConfigValues, get_active_config_path
 
 # Import the main CLI entry point
 from arda_cli.main import (
@@ -170,6 +171,22 @@ class TestCLIRouting:
         result = runner.invoke(main, ["unknown-command"])
         assert result.exit_code != 0
 
+    def test_commands_are_listed_and_loaded_lazily(self):
+        """Test that every command is listed and loads on lookup."""
+        ctx = click.Context(main)
+        assert main.list_commands(ctx) == [
+            "config",
+            "flakes",
+            "host",
+            "roles",
+            "secrets",
+            "theme",
+        ]
+        command = main.get_command(ctx, "roles")
+        assert command is not None
+        assert command.name == "roles"
+        assert main.get_command(ctx, "unknown-command") is None
+
 
 @pytest.mark.integration
 @pytest.mark.cli
@@ -191,8 +208,8 @@ class TestCLIContext:
         """Test verbose flag in CLI context."""
         runner = CliRunner()
 
-        with patch("arda_cli.main.get_verbose_from_config") as mock_verbose:
-            mock_verbose.return_value = False
+        with patch("arda_cli.main.get_config_values") as mock_values:
+            mock_values.return_value = ConfigValues("dracula", False, True)
             result = runner.invoke(main, ["--verbose", "config", "--help"])
             assert result.exit_code == 0
 
@@ -200,8 +217,8 @@ class TestCLIContext:
         """Test timestamp flag in CLI context."""
         runner = CliRunner()
 
-        with patch("arda_cli.main.get_timestamp_from_config") as mock_timestamp:
-            mock_timestamp.return_value = False
+        with patch("arda_cli.main.get_config_values") as mock_values:
+            mock_values.return_value = ConfigValues("dracula", False, False)
             result = runner.invoke(main, ["--timestamp", "config", "--help"])
             assert result.exit_code == 0
 
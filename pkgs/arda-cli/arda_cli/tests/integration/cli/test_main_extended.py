@@ -131,18 +131,18 @@ timestamp = false
         runner = CliRunner()
 
         with runner.isolated_filesystem():
-            # Patch Path.home() and tomli_w
+            # Patch Path.home() and tomli_w.dump (imported when it's needed)
             with patch("pathlib.Path.home", return_value=Path.cwd()):
-                with patch("arda_cli.main.tomli_w") as mock_tomli_w:
+                with patch("tomli_w.dump") as mock_dump:
                     # Run config view to trigger config creation
                     result = runner.invoke(main, ["config", "view"])
                     assert result.exit_code == 0
 
                     # Verify tomli_w.dump was called
-                    mock_tomli_w.dump.assert_called_once()
+                    mock_dump.assert_called_once()
 
                     # Verify it was called with valid arguments
-                    call_args = mock_tomli_w.dump.call_args
+                    call_args = mock_dump.call_args
                     assert call_args is not None
 
 
@@ -21,6 +21,7 @@ sys.path.insert(0, str(PathLib(__file__).parent.parent.parent.parent.parent))
 from arda_cli.lib.config import (
     get_config_for_viewing,
     get_config_path,
+    get_config_values,
     get_theme_from_config,
     get_timestamp_from_config,
     get_verbose_from_config,
@@ -156,6 +157,7 @@ timestamp = false
             assert theme == "forest"
             assert verbose is True
             assert timestamp is False
+            assert get_config_values() == ("forest", True, False)
 
 
 @pytest.mark.slow
@@ -186,6 +188,32 @@ def test_config_set_value():
         assert config["output"]["verbose"] is True
 
 
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.config
+@pytest.mark.with_core
+def test_config_reread_after_set_value():
+    """Test that cached config reads pick up values written by set_config_value."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        config_file = temp_path / "etc" / "arda.toml"
+
+        set_config_value(config_file, "theme", "default", "nord")
+
+        with patch("pathlib.Path.cwd", return_value=temp_path):
+            first = get_config_for_viewing(force_local=True)
+            assert first["theme"]["default"] == "nord"
+
+            # Mutating a returned config must not leak into later reads
+            first["theme"]["default"] = "mutated"
+            again = get_config_for_viewing(force_local=True)
+            assert again["theme"]["default"] == "nord"
+
+            set_config_value(config_file, "theme", "default", "forest")
+            second = get_config_for_viewing(force_local=True)
+            assert second["theme"]["default"] == "forest"
+
+
 @pytest.mark.slow
 @pytest.mark.integration
 @pytest.mark.config
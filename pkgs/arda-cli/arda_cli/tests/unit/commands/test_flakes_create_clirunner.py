@@ -0,0 +1,369 @@
+"""CliRunner tests for the flakes create command.
+
+This module runs 'arda flakes create' end to end against fake `nix` and
+`age-keygen` executables placed first on PATH; git is the real one.
+
+Tests cover:
+- --force replacing an existing world (directory, file or symlink)
+- A failed --force swap leaving the existing world untouched
+- File and directory modes of the copied template, with and without reflinks
+- Streaming nix output and the age key deployment
+"""
+
+# ruff: noqa: S103, S603
+
+import errno
+import os
+import stat
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# Import base test infrastructure
+from arda_cli.tests.unit.commands import BaseCommandTest
+
+FAKE_NIX = """#!/bin/sh
+echo "warning: fetching input 'nixpkgs'"
+echo '{}' > flake.lock
+exit %d
+"""
+
+FAKE_AGE_KEYGEN = """#!/bin/sh
+if [ "$1" = "-o" ]; then
+    printf '# public key: age1testkey\\nAGE-SECRET-KEY-1TEST\\n' > "$2"
+    exit 0
+fi
+echo age1testkey
+"""
+
+
+def _write_script(path: Path, content: str) -> None:
+    path.write_text(content)
+    path.chmod(0o755)
+
+
+def _join_cleanup_threads() -> None:
+    """Wait for the thread that deletes the tree replaced by --force."""
+    from arda_cli.commands.flakes.create import _CLEANUP_THREAD_NAME
+
+    for thread in threading.enumerate():
+        if thread.name == _CLEANUP_THREAD_NAME:
+            thread.join()
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestFlakesCreateWithCliRunner(BaseCommandTest):
+    """Test 'arda flakes create' with fake nix and age-keygen on PATH."""
+
+    @pytest.fixture
+    def world_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+        """Run in an empty directory with fake tools and an isolated home."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        _write_script(bin_dir / "nix", FAKE_NIX % 0)
+        _write_script(bin_dir / "age-keygen", FAKE_AGE_KEYGEN)
+
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        monkeypatch.chdir(work_dir)
+
+        return {
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+            "HOME": str(tmp_path / "home"),
+            "XDG_CONFIG_HOME": str(tmp_path / "xdg"),
+            "GIT_AUTHOR_NAME": "Arda Test",
+            "GIT_AUTHOR_EMAIL": "test@example.com",
+            "GIT_COMMITTER_NAME": "Arda Test",
+            "GIT_COMMITTER_EMAIL": "test@example.com",
+            "GIT_CONFIG_NOSYSTEM": "1",
+        }
+
+    @pytest.fixture
+    def readonly_template(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[Path]:
+        """Provide a template with Nix store (read-only) permissions."""
+        from arda_cli.commands.flakes import create as create_module
+
+        templates_dir = tmp_path / "templates"
+        template = templates_dir / "default"
+        (template / "modules" / "hosts").mkdir(parents=True)
+        (template / "flake.nix").write_text("{ outputs = _: { }; }\n")
+        (template / "modules" / "hosts" / "default.nix").write_text("{ }\n")
+        for path in (
+            template / "flake.nix",
+            template / "modules" / "hosts" / "default.nix",
+        ):
+            path.chmod(0o444)
+        for path in (template / "modules" / "hosts", template / "modules", template):
+            path.chmod(0o555)
+
+        monkeypatch.setattr(create_module, "_find_templates_dir", lambda: templates_dir)
+        yield template
+
+        # Let pytest remove the template again
+        for root, dirs, _files in os.walk(template):
+            for d in dirs:
+                os.chmod(os.path.join(root, d), 0o755)
+        template.chmod(0o755)
+
+    def invoke_create(self, runner, env: dict, args: list):
+        """Invoke the create command, confirming the creation prompt."""
+        from arda_cli.commands.flakes.create import create
+
+        return runner.invoke(
+            create,
+            args,
+            input="y\n",
+            env=env,
+            obj={"theme": "dracula", "verbose": True, "timestamp": False},
+        )
+
+    # ============================================================
+    # TEST --force
+    # ============================================================
+
+    def test_create_new_world(self, runner, world_env):
+        """Test: arda flakes create w1 (new directory, git commit, age key)."""
+        result = self.invoke_create(runner, world_env, ["w1"])
+        assert result.exit_code == 0, result.output
+        assert "Successfully created Arda world" in result.output
+
+        world = Path("w1")
+        assert (world / "flake.nix").is_file()
+        assert (world / "flake.lock").is_file()
+        assert (Path(world_env["XDG_CONFIG_HOME"]) / "sops/age/keys.txt").is_file()
+
+        key_json = next((world / "sops" / "users").glob("*/key.json"))
+        assert "age1testkey" in key_json.read_text()
+
+    def test_force_replaces_existing_world(self, runner, world_env):
+        """Test: --force leaves no files from the replaced world behind."""
+        old_world = Path("w1")
+        (old_world / "modules").mkdir(parents=True)
+        (old_world / "stale.txt").write_text("old")
+        (old_world / "modules" / "stale.nix").write_text("{ }")
+
+        result = self.invoke_create(runner, world_env, ["w1", "--force"])
+        _join_cleanup_threads()
+
+        assert result.exit_code == 0, result.output
+        assert (old_world / "flake.nix").is_file()
+        assert not (old_world / "stale.txt").exists()
+        assert not (old_world / "modules" / "stale.nix").exists()
+        # Neither the staging copy nor the replaced tree is left over
+        assert sorted(os.listdir()) == ["w1"]
+
+    @pytest.mark.parametrize("kind", ["file", "symlink", "dangling_symlink"])
+    def test_force_replaces_non_directory(self, runner, world_env, kind):
+        """Test: --force replaces a file or symlink without leaving it behind."""
+        elsewhere = Path("..") / "elsewhere"
+        if kind == "file":
+            Path("w1").write_text("not a world")
+        elif kind == "symlink":
+            elsewhere.mkdir()
+            (elsewhere / "keep.txt").write_text("keep")
+            os.symlink(elsewhere, "w1")
+        else:
+            os.symlink("nowhere", "w1")
+
+        result = self.invoke_create(runner, world_env, ["w1", "--force"])
+        _join_cleanup_threads()
+
+        assert result.exit_code == 0, result.output
+        assert Path("w1").is_dir() and not Path("w1").is_symlink()
+        assert sorted(os.listdir()) == ["w1"]
+        if kind == "symlink":
+            # Only the link is removed, never the directory it pointed to
+            assert (elsewhere / "keep.txt").read_text() == "keep"
+
+    def test_existing_world_without_force_fails(self, runner, world_env):
+        """Test: an existing target is refused without --force."""
+        Path("w1").mkdir()
+        result = self.invoke_create(runner, world_env, ["w1"])
+        assert result.exit_code == 1
+        assert "already" in result.output and "exists" in result.output
+
+    def test_failed_swap_keeps_old_world(self, runner, world_env, monkeypatch):
+        """Test: if the staged world can't be moved in, the old one stays."""
+        old_world = Path("w1")
+        old_world.mkdir()
+        (old_world / "stale.txt").write_text("old")
+
+        real_rename = Path.rename
+
+        def failing_rename(self, target):
+            if self.name.startswith(".w1.staging-"):
+                raise OSError("rename failed")
+            return real_rename(self, target)
+
+        monkeypatch.setattr(Path, "rename", failing_rename)
+
+        result = self.invoke_create(runner, world_env, ["w1", "--force"])
+        _join_cleanup_threads()
+
+        assert result.exit_code == 1
+        assert "rename failed" in result.output
+        assert (old_world / "stale.txt").read_text() == "old"
+        assert not (old_world / "flake.nix").exists()
+        assert sorted(os.listdir()) == ["w1"]
+
+    def test_failed_copy_keeps_old_world(self, runner, world_env, monkeypatch):
+        """Test: a failed template copy doesn't touch the existing world."""
+        from arda_cli.commands.flakes import create as create_module
+
+        old_world = Path("w1")
+        old_world.mkdir()
+        (old_world / "stale.txt").write_text("old")
+
+        def failing_copy(src, dst):
+            raise OSError("copy failed")
+
+        monkeypatch.setattr(create_module, "_copy_writable", failing_copy)
+
+        result = self.invoke_create(runner, world_env, ["w1", "--force"])
+
+        assert result.exit_code == 1
+        assert (old_world / "stale.txt").read_text() == "old"
+        assert sorted(os.listdir()) == ["w1"]
+
+    # ============================================================
+    # TEST TEMPLATE COPY
+    # ============================================================
+
+    @pytest.mark.parametrize("reflink", [True, False])
+    def test_copied_template_modes(
+        self, runner, world_env, readonly_template, monkeypatch, reflink
+    ):
+        """Test: read-only template files arrive as 0o644, directories as 0o755."""
+        from arda_cli.commands.flakes import create as create_module
+
+        # With reflinks enabled, filesystems without FICLONE support fall
+        # back to a regular copy; the modes must be the same either way
+        monkeypatch.setattr(
+            create_module,
+            "_reflink_supported",
+            reflink and create_module._reflink_supported,
+        )
+
+        result = self.invoke_create(runner, world_env, ["w1"])
+        assert result.exit_code == 0, result.output
+
+        world = Path("w1")
+        assert (world / "flake.nix").read_text() == "{ outputs = _: { }; }\n"
+
+        def mode(path: Path) -> int:
+            return stat.S_IMODE(path.stat().st_mode)
+
+        assert mode(world) == 0o755
+        assert mode(world / "modules") == 0o755
+        assert mode(world / "modules" / "hosts") == 0o755
+        assert mode(world / "flake.nix") == 0o644
+        assert mode(world / "modules" / "hosts" / "default.nix") == 0o644
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="reflinks are Linux-only")
+    @pytest.mark.parametrize(
+        ("error", "disables_reflinks"),
+        [(errno.EOPNOTSUPP, True), (errno.EXDEV, True), (errno.EIO, False)],
+    )
+    def test_reflink_errors(self, tmp_path, monkeypatch, error, disables_reflinks):
+        """Test: only "not supported" ioctl errors fall back to copying."""
+        from arda_cli.commands.flakes import create as create_module
+
+        def failing_ioctl(fd, request, arg):
+            raise OSError(error, os.strerror(error))
+
+        monkeypatch.setattr(create_module, "_reflink_supported", True)
+        monkeypatch.setattr(create_module.fcntl, "ioctl", failing_ioctl)
+        src = tmp_path / "src"
+        src.write_text("data")
+        dst = tmp_path / "dst"
+
+        if disables_reflinks:
+            create_module._copy_writable(str(src), str(dst))
+            assert dst.read_text() == "data"
+            assert stat.S_IMODE(dst.stat().st_mode) == 0o644
+        else:
+            with pytest.raises(OSError) as excinfo:
+                create_module._copy_writable(str(src), str(dst))
+            assert excinfo.value.errno == error
+        assert create_module._reflink_supported is not disables_reflinks
+
+    def test_missing_source_keeps_reflinks(self, tmp_path, monkeypatch):
+        """Test: failing to open a file says nothing about reflink support."""
+        from arda_cli.commands.flakes import create as create_module
+
+        monkeypatch.setattr(create_module, "_reflink_supported", True)
+
+        with pytest.raises(FileNotFoundError):
+            create_module._copy_writable(
+                str(tmp_path / "missing"), str(tmp_path / "dst")
+            )
+        assert create_module._reflink_supported is True
+
+    # ============================================================
+    # TEST NIX AND GIT STEPS
+    # ============================================================
+
+    def test_initial_commit_created(self, runner, world_env):
+        """Test: the world is committed, including flake.lock and sops."""
+        import subprocess
+
+        result = self.invoke_create(runner, world_env, ["w1"])
+        assert result.exit_code == 0, result.output
+
+        git = ["git", "-C", "w1"]
+        log = subprocess.run(
+            [*git, "log", "--format=%s"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, **world_env},
+            check=True,
+        )
+        assert log.stdout.strip() == "Initial w1 world"
+        files = subprocess.run(
+            [*git, "ls-files"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, **world_env},
+            check=True,
+        )
+        assert "flake.lock" in files.stdout.split()
+
+    def test_flake_update_failure_is_a_warning(self, runner, world_env):
+        """Test: a failing nix flake update warns and shows nix's output."""
+        bin_dir = Path(world_env["PATH"].split(os.pathsep)[0])
+        _write_script(bin_dir / "nix", FAKE_NIX % 1)
+
+        result = self.invoke_create(runner, world_env, ["w1"])
+
+        assert result.exit_code == 0, result.output
+        assert "Flake update had warnings" in result.output
+        assert "fetching input 'nixpkgs'" in result.output
+
+    def test_interrupted_flake_update_stops_nix(self, runner, world_env, monkeypatch):
+        """Test: nix is killed and reaped if streaming its output fails."""
+        import rich.markup
+
+        bin_dir = Path(world_env["PATH"].split(os.pathsep)[0])
+        pid_file = bin_dir / "nix.pid"
+        _write_script(
+            bin_dir / "nix",
+            f"#!/bin/sh\necho $$ > {pid_file}\necho fetching\nexec sleep 60\n",
+        )
+
+        def failing_escape(markup):
+            raise RuntimeError("streaming failed")
+
+        monkeypatch.setattr(rich.markup, "escape", failing_escape)
+
+        result = self.invoke_create(runner, world_env, ["w1"])
+
+        assert result.exit_code == 1
+        assert "streaming failed" in result.output
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
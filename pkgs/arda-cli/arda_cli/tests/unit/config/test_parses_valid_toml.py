@@ -502,3 +502,42 @@ def test_temp_directory_cleanup_on_exception():
 
     # Verify we're back in original directory
     assert os.getcwd() == original_dir
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+@pytest.mark.config
+def test_precompiled_default_config_matches_arda_toml():
+    """Test that the precompiled defaults match the packaged arda.toml."""
+    import tomllib
+    from pathlib import Path
+
+    import arda_cli
+    from arda_cli._default_config import DEFAULT_CONFIG
+    from arda_cli.lib.config import load_default_config
+
+    toml_path = Path(arda_cli.__file__).parent / "arda.toml"
+    with open(toml_path, "rb") as f:
+        assert tomllib.load(f) == DEFAULT_CONFIG
+
+    # Callers get a private copy they can mutate
+    loaded = load_default_config()
+    loaded["theme"]["default"] = "nord"
+    assert DEFAULT_CONFIG["theme"]["default"] == "forest"
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+@pytest.mark.config
+def test_deep_merge_overrides_nested_values():
+    """Test that _deep_merge merges nested sections and overrides leaves."""
+    from arda_cli.lib.config import _deep_merge
+
+    base = {"theme": {"default": "forest"}, "output": {"verbose": False}}
+    update = {"output": {"verbose": True, "timestamp": False}, "extra": 1}
+
+    assert _deep_merge(base, update) == {
+        "theme": {"default": "forest"},
+        "output": {"verbose": True, "timestamp": False},
+        "extra": 1,
+    }